@@ -0,0 +1,61 @@
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.ollama_stub_server import start_stub_server
+from clickbait_dataset_builder import ClickbaitDatasetBuilder, generate_clickbait_ollama
+
+
+def bench_serial(titulos, url):
+    # Equivalente al bucle original del notebook (sin el time.sleep(0.25))
+    start = time.perf_counter()
+    for titulo in titulos:
+        generate_clickbait_ollama(titulo, url=url)
+    return len(titulos) / (time.perf_counter() - start)
+
+
+def bench_builder(titulos, url, max_workers, batch_size):
+    with tempfile.TemporaryDirectory() as tmp:
+        builder = ClickbaitDatasetBuilder(
+            output_file=os.path.join(tmp, 'dataset.csv'),
+            url=url,
+            max_workers=max_workers,
+            batch_size=batch_size,
+            verbose=False
+        )
+        start = time.perf_counter()
+        builder.build(titulos)
+        elapsed = time.perf_counter() - start
+
+        # Segunda pasada: todo se resuelve desde el archivo existente
+        start = time.perf_counter()
+        builder.build(titulos)
+        resume_elapsed = time.perf_counter() - start
+    return len(titulos) / elapsed, resume_elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del generador de dataset de clickbaits")
+    parser.add_argument('--n', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--batch-size', type=int, default=50)
+    args = parser.parse_args()
+
+    server, url = start_stub_server(latency=args.latency)
+    titulos = [f"titular de prueba numero {i}" for i in range(args.n)]
+
+    try:
+        serial = bench_serial(titulos, url)
+        concurrent, resume_elapsed = bench_builder(titulos, url, args.workers, args.batch_size)
+    finally:
+        server.shutdown()
+
+    print(f"Serial:      {serial:.1f} titulares/s")
+    print(f"Concurrente: {concurrent:.1f} titulares/s ({args.workers} workers, x{concurrent / serial:.1f})")
+    print(f"Reanudación sin trabajo pendiente: {resume_elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from tensorflow.keras.layers import Input
+from tensorflow.keras.models import Model
+from tensorflow.keras.preprocessing.sequence import pad_sequences
+
+from benchmarks.bench_seq2seq_training import load_texts
+from clickbait_decoder import ClickbaitDecoder, DATASET_FILE
+from seq2seq_model import build_seq2seq_model, fit_tokenizers, max_sequence_length
+
+
+def build_legacy_models(decoder):
+    # Modelos de inferencia tal como se construyen en parte_2_5_notebook.ipynb
+    _, state_h, state_c = decoder.encoder_lstm.output
+    encoder_model = Model(decoder.model.inputs[0], [state_h, state_c])
+
+    decoder_state_input_h = Input(shape=(decoder.latent_dim,))
+    decoder_state_input_c = Input(shape=(decoder.latent_dim,))
+    decoder_inputs_single = Input(shape=(1,))
+    embedded = decoder.decoder_embedding(decoder_inputs_single)
+    outputs, h, c = decoder.decoder_lstm(embedded, initial_state=[decoder_state_input_h, decoder_state_input_c])
+    outputs = decoder.decoder_dense(outputs)
+    decoder_model = Model(
+        [decoder_inputs_single, decoder_state_input_h, decoder_state_input_c],
+        [outputs, h, c]
+    )
+    return encoder_model, decoder_model
+
+
+def legacy_generate(decoder, encoder_model, decoder_model, input_text, max_length=50):
+    input_seq = decoder.input_tokenizer.texts_to_sequences([input_text])
+    input_seq = pad_sequences(input_seq, maxlen=decoder.max_encoder_len, padding='post')
+    states_value = encoder_model.predict(input_seq, verbose=0)
+
+    target_seq = np.zeros((1, 1))
+    target_seq[0, 0] = decoder.start_token
+    decoded_sentence = []
+
+    while True:
+        output_tokens, h, c = decoder_model.predict([target_seq] + states_value, verbose=0)
+        sampled_token_index = np.argmax(output_tokens[0, -1, :])
+        sampled_word = decoder.index_to_word.get(sampled_token_index, None)
+
+        if sampled_word is None or sampled_word == '':
+            break
+        if sampled_word == '<end>' or len(decoded_sentence) >= max_length:
+            break
+        if sampled_word != '<start>':
+            decoded_sentence.append(sampled_word)
+
+        target_seq = np.zeros((1, 1))
+        target_seq[0, 0] = sampled_token_index
+        states_value = [h, c]
+
+    return ' '.join(decoded_sentence)
+
+
+def load_decoder(args):
+    if not args.synthetic:
+        try:
+            decoder = ClickbaitDecoder.from_files()
+            headlines = pd.read_csv(DATASET_FILE, encoding='utf-8')['titulo_limpio'].dropna().tolist()[:args.n]
+            return decoder, headlines
+        except (OSError, ValueError, KeyError) as e:
+            # Sin el modelo entrenado (p. ej. punteros de git-lfs)
+            print(f"No se pudo cargar el modelo entrenado ({e}): se usa uno aleatorio del mismo tamaño")
+
+    # Pesos aleatorios con la arquitectura del notebook y tokenizers ajustados sobre titulares sintéticos
+    headlines, targets = load_texts(args.n, synthetic=True)
+    input_tokenizer, target_tokenizer = fit_tokenizers(headlines, targets)
+    model = build_seq2seq_model(
+        len(input_tokenizer.word_index) + 1,
+        len(target_tokenizer.word_index) + 1,
+        embedding_dim=args.embedding_dim,
+        latent_dim=args.latent_dim
+    )
+    decoder = ClickbaitDecoder(
+        model, input_tokenizer, target_tokenizer, max_encoder_len=max_sequence_length(input_tokenizer, headlines)
+    )
+    return decoder, headlines
+
+
+def timed(func):
+    start = time.perf_counter()
+    results = func()
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de decodificación del generador seq2seq (CPU)")
+    parser.add_argument('--n', type=int, default=64)
+    parser.add_argument('--legacy-n', type=int, default=16, help="titulares para el bucle original (es lento)")
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--beam-width', type=int, default=3)
+    parser.add_argument('--max-length', type=int, default=50)
+    parser.add_argument('--synthetic', action='store_true', help="modelo aleatorio y titulares sintéticos")
+    parser.add_argument('--embedding-dim', type=int, default=512)
+    parser.add_argument('--latent-dim', type=int, default=1024)
+    args = parser.parse_args()
+
+    decoder, headlines = load_decoder(args)
+    encoder_model, decoder_model = build_legacy_models(decoder)
+
+    # Calentamiento: trazado de tf.function y construcción de los modelos de predict
+    decoder.generate(headlines[:2], max_length=2)
+    decoder.generate(headlines[:2], method='beam', beam_width=args.beam_width, max_length=2)
+    legacy_generate(decoder, encoder_model, decoder_model, headlines[0], max_length=2)
+
+    legacy_headlines = headlines[:args.legacy_n]
+    _, legacy_time = timed(lambda: [
+        legacy_generate(decoder, encoder_model, decoder_model, h, args.max_length) for h in legacy_headlines
+    ])
+    _, greedy_time = timed(lambda: decoder.generate(
+        headlines, batch_size=args.batch_size, max_length=args.max_length
+    ))
+    _, beam_time = timed(lambda: decoder.generate(
+        headlines, method='beam', batch_size=args.batch_size, beam_width=args.beam_width, max_length=args.max_length
+    ))
+
+    legacy_rate = len(legacy_headlines) / legacy_time
+    greedy_rate = len(headlines) / greedy_time
+    beam_rate = len(headlines) / beam_time
+    print(f"Bucle original (predict):   {legacy_rate:.2f} titulares/s")
+    print(f"Greedy por lotes:           {greedy_rate:.2f} titulares/s (x{greedy_rate / legacy_rate:.1f})")
+    print(f"Beam search (k={args.beam_width}) por lotes: {beam_rate:.2f} titulares/s (x{beam_rate / legacy_rate:.1f})")
+
+
+if __name__ == "__main__":
+    main()
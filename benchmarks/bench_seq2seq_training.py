@@ -0,0 +1,95 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from tensorflow import keras
+from tensorflow.keras.preprocessing.sequence import pad_sequences
+
+from clickbait_decoder import DATASET_FILE
+from seq2seq_dataset import make_dataset, to_sequences
+from seq2seq_model import build_seq2seq_model, fit_tokenizers
+
+
+class EpochTimer(keras.callbacks.Callback):
+    def on_train_begin(self, logs=None):
+        self.times = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.start = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.times.append(time.perf_counter() - self.start)
+
+
+def load_texts(n, synthetic):
+    if not synthetic:
+        df = pd.read_csv(DATASET_FILE, encoding='utf-8').dropna().head(n)
+        return df['titulo_limpio'].tolist(), ('<start> ' + df['clickbait'] + ' <end>').tolist()
+
+    # Longitudes sesgadas como las de los titulares reales: la mayoría cortas, pocas cerca del máximo
+    rng = np.random.default_rng(42)
+    words = [f"palabra{i}" for i in range(4000)]
+    input_lengths = np.clip(rng.gamma(4, 3, n).astype(int) + 3, 3, 60)
+    target_lengths = np.clip(rng.gamma(4, 3, n).astype(int) + 3, 3, 50)
+    inputs = [' '.join(rng.choice(words, k)) for k in input_lengths]
+    targets = ['<start> ' + ' '.join(rng.choice(words, k)) + ' <end>' for k in target_lengths]
+    return inputs, targets
+
+
+def build_model(input_tokenizer, target_tokenizer, args, max_encoder_len=None, max_decoder_len=None):
+    model = build_seq2seq_model(
+        len(input_tokenizer.word_index) + 1,
+        len(target_tokenizer.word_index) + 1,
+        max_encoder_len=max_encoder_len,
+        max_decoder_len=max_decoder_len,
+        embedding_dim=args.embedding_dim,
+        latent_dim=args.latent_dim
+    )
+    model.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark por época del entrenamiento seq2seq en CPU")
+    parser.add_argument('--n', type=int, default=1000)
+    parser.add_argument('--epochs', type=int, default=2, help="la primera época incluye el trazado y no se cuenta")
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--embedding-dim', type=int, default=512)
+    parser.add_argument('--latent-dim', type=int, default=1024)
+    parser.add_argument('--synthetic', action='store_true')
+    args = parser.parse_args()
+
+    input_texts, target_texts = load_texts(args.n, args.synthetic)
+    input_tokenizer, target_tokenizer = fit_tokenizers(input_texts, target_texts)
+    encoder_sequences, decoder_sequences = to_sequences(input_texts, target_texts, input_tokenizer, target_tokenizer)
+
+    # Pipeline original: todo rellenado a la longitud máxima global
+    max_encoder_len = max(len(seq) for seq in encoder_sequences)
+    max_decoder_len = max(len(seq) for seq in decoder_sequences)
+    encoder_input = pad_sequences(encoder_sequences, maxlen=max_encoder_len, padding='post')
+    decoder_input = pad_sequences(decoder_sequences, maxlen=max_decoder_len, padding='post')
+    decoder_output = np.zeros_like(decoder_input)
+    decoder_output[:, :-1] = decoder_input[:, 1:]
+
+    padded_timer = EpochTimer()
+    model = build_model(input_tokenizer, target_tokenizer, args, max_encoder_len, max_decoder_len)
+    model.fit([encoder_input, decoder_input], decoder_output, batch_size=args.batch_size,
+              epochs=args.epochs, callbacks=[padded_timer], verbose=0)
+
+    bucketed_timer = EpochTimer()
+    dataset = make_dataset(encoder_sequences, decoder_sequences, batch_size=args.batch_size)
+    model = build_model(input_tokenizer, target_tokenizer, args)
+    model.fit(dataset, epochs=args.epochs, callbacks=[bucketed_timer], verbose=0)
+
+    padded_time = np.mean(padded_timer.times[1:] or padded_timer.times)
+    bucketed_time = np.mean(bucketed_timer.times[1:] or bucketed_timer.times)
+    real_tokens = sum(len(e) + len(d) for e, d in zip(encoder_sequences, decoder_sequences))
+    padded_tokens = encoder_input.size + decoder_input.size
+    print(f"Tokens reales / rellenados: {real_tokens / padded_tokens:.0%}")
+    print(f"Relleno global (pad_sequences): {padded_time:.1f} s/época")
+    print(f"tf.data con buckets:            {bucketed_time:.1f} s/época (x{padded_time / bucketed_time:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Rutas servidas por cada sitio: (patrón de la ruta, fixture)
+SITES = {
+    'diariocorreo': [
+        (re.compile(r'^/archivo/todas/\d{4}-\d{2}-\d{2}/$'), 'archivo.html'),
+        (re.compile(r'^/[\w-]+/[\w-]+/$'), 'articulo.html'),
+    ],
+    'peru21': [
+        (re.compile(r'^/archivo/todas/\d{4}-\d{2}-\d{2}/$'), 'archivo_1.html'),
+        (re.compile(r'^/archivo/todas/\d{4}-\d{2}-\d{2}/2/$'), 'archivo_2.html'),
+        (re.compile(r'^/[\w-]+/[\w-]+/$'), 'articulo.html'),
+    ],
+}
+
+
+def load_fixtures(site):
+    fixtures = {}
+    for _, name in SITES[site]:
+        with open(os.path.join(FIXTURES_DIR, site, name), 'rb') as file:
+            fixtures[name] = file.read()
+    return fixtures
+
+
+class NewsStubHandler(BaseHTTPRequestHandler):
+    routes = []
+    fixtures = {}
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+
+        for pattern, name in self.routes:
+            if pattern.match(self.path):
+                body = self.fixtures[name]
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+        self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_news_stub_server(site, host='127.0.0.1', port=0, latency=0.0):
+    handler = type('ConfiguredNewsStubHandler', (NewsStubHandler,), {
+        'routes': SITES[site],
+        'fixtures': load_fixtures(site),
+        'latency': latency
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{server.server_address[0]}:{server.server_address[1]}"
@@ -0,0 +1,78 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class OllamaStubHandler(BaseHTTPRequestHandler):
+    latency = 0.05
+    error_rate = 0.0
+    malformed_rate = 0.0
+
+    def do_POST(self):
+        if self.path != '/api/generate':
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        time.sleep(self.latency)
+
+        if random.random() < self.error_rate:
+            self.send_error(503)
+            return
+
+        if random.random() < self.malformed_rate:
+            # 200 con un cuerpo inservible: alterna entre texto no JSON y JSON sin 'response'
+            body = random.choice([b'<html>upstream error</html>', b'{"error": "model not loaded"}'])
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        titular = payload.get('prompt', '').split('Titular original:')[-1].split('\n')[0].strip()
+        body = json.dumps({
+            'model': payload.get('model'),
+            'response': f'"¡No creerás lo que pasó! {titular[:60]}"',
+            'done': True
+        }).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(host='127.0.0.1', port=0, latency=0.05, error_rate=0.0, malformed_rate=0.0):
+    handler = type('ConfiguredOllamaStubHandler', (OllamaStubHandler,), {
+        'latency': latency,
+        'error_rate': error_rate,
+        'malformed_rate': malformed_rate
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://{server.server_address[0]}:{server.server_address[1]}/api/generate"
+    return server, url
+
+
+def main():
+    server, url = start_stub_server(port=11434)
+    print(f"Stub de Ollama escuchando en {url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from benchmarks.news_stub_server import FIXTURES_DIR, start_news_stub_server
+from utils.metrics import Metrics, profile
+from utils.utils import clean_text
+
+
+def fixture_corpus(n_docs, seed=42):
+    # Documentos sintéticos combinando los párrafos y titulares de las fixtures HTML
+    paragraphs, titles = [], []
+    for site, listing, body_class in [
+        ('diariocorreo', 'archivo.html', 'story-contents__content'),
+        ('peru21', 'archivo_1.html', 'field--name-body'),
+    ]:
+        with open(os.path.join(FIXTURES_DIR, site, 'articulo.html'), encoding='utf-8') as file:
+            body = BeautifulSoup(file.read(), 'lxml').find('div', class_=body_class)
+            paragraphs.extend(p.get_text() for p in body.find_all('p'))
+        with open(os.path.join(FIXTURES_DIR, site, listing), encoding='utf-8') as file:
+            titles.extend(h.get_text().strip() for h in BeautifulSoup(file.read(), 'lxml').find_all('h2'))
+
+    rng = random.Random(seed)
+    secciones = ['Política', 'Deportes', 'Economía', 'Mundo', 'Policiales', 'Espectáculos', 'Cultura']
+    return pd.DataFrame([{
+        'titulo': rng.choice(titles),
+        'contenido': " ".join(rng.sample(paragraphs, min(len(paragraphs), rng.randint(3, 8)))),
+        'seccion': rng.choice(secciones)
+    } for _ in range(n_docs)])
+
+
+def load_corpus(args):
+    if args.corpus:
+        df = pd.read_csv(args.corpus, encoding="utf-8", sep="\t", dtype="string", quoting=0, na_filter=False)
+        return df.head(args.docs), True
+    return fixture_corpus(args.docs), False
+
+
+def bench_scrapers(metrics, args, corpus):
+    from scrapper import NewsScrapper
+    from scrapper_peru21 import Peru21Scrapper
+
+    for site, scraper_class in [('diariocorreo', NewsScrapper), ('peru21', Peru21Scrapper)]:
+        server, url = start_news_stub_server(site, latency=args.latency)
+        scraper = scraper_class(max_workers=args.workers, verbose=False)
+        scraper.base_url = url
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                for day in range(args.days):
+                    scraper.extract(datetime(2025, 10, 16) - timedelta(days=day), output_file=os.path.join(tmp, 'noticias.tsv'))
+        finally:
+            server.shutdown()
+        metrics.merge(scraper.metrics, prefix=f"{site}.")
+
+
+def bench_clean_text(metrics, args, corpus):
+    texts = (corpus['titulo'] + " " + corpus['contenido']).tolist()
+    for text in texts:
+        with metrics.timer('clean_text'):
+            clean_text(text)
+        metrics.incr('clean_text.chars', len(text))
+
+
+def bench_trigrams(metrics, args, corpus):
+    # Mismo pipeline que parte_2_1_notebook.ipynb: tokenización NLTK, conteo de trigramas y muestreo con fallbacks
+    from trigram_model import generate_sentence, load_corpus, train_trigrams
+
+    with metrics.timer('trigrams.tokenize'):
+        sentences = load_corpus(corpus)["_GLOBAL"]
+    with metrics.timer('trigrams.train'):
+        model = train_trigrams(sentences)
+    metrics.incr('trigrams.sentences', len(sentences))
+    metrics.incr('trigrams.contexts', len(model))
+
+    random.seed(42)
+    for _ in range(args.sentences):
+        with metrics.timer('trigrams.generate_sentence'):
+            generate_sentence(model)
+
+
+def bench_lda_tfidf(metrics, args, corpus, real_corpus=False):
+    import gensim
+    from gensim import models
+    from nltk.stem.snowball import SnowballStemmer
+
+    try:
+        from nltk.corpus import stopwords
+        stop_words = set(stopwords.words("spanish"))
+    except LookupError:
+        stop_words = set()
+    stemmer = SnowballStemmer('spanish')
+
+    def preprocess(text):
+        return [stemmer.stem(t) for t in gensim.utils.simple_preprocess(text) if t not in stop_words and len(t) > 3]
+
+    texts = (corpus['seccion'] + " " + corpus['titulo'] + " " + corpus['contenido']).map(clean_text)
+    with metrics.timer('lda.preprocess'):
+        processed_docs = texts.map(preprocess).tolist()
+    with metrics.timer('lda.dictionary'):
+        dictionary = gensim.corpora.Dictionary(processed_docs)
+        if real_corpus:
+            dictionary.filter_extremes(no_below=10, no_above=0.3, keep_n=100000)
+        bow_corpus = [dictionary.doc2bow(doc) for doc in processed_docs]
+    with metrics.timer('tfidf.build'):
+        tfidf_corpus = list(models.TfidfModel(bow_corpus)[bow_corpus])
+    metrics.incr('tfidf.nonzero', sum(len(doc) for doc in tfidf_corpus))
+    with metrics.timer('lda.train'):
+        models.LdaMulticore(
+            bow_corpus,
+            num_topics=7,
+            id2word=dictionary,
+            passes=args.lda_passes,
+            workers=max(1, min(4, os.cpu_count() - 1)),
+            eval_every=None,
+            random_state=42
+        )
+
+
+def bench_seq2seq(metrics, args, corpus):
+    from clickbait_decoder import ClickbaitDecoder
+    from seq2seq_model import build_seq2seq_model, fit_tokenizers, max_sequence_length
+
+    try:
+        decoder = ClickbaitDecoder.from_files()
+    except (OSError, ValueError):
+        # Sin el modelo entrenado (p. ej. puntero de git-lfs): pesos aleatorios con la misma arquitectura
+        metrics.incr('seq2seq.random_model')
+        titles = corpus['titulo'].map(clean_text).tolist()
+        input_tokenizer, target_tokenizer = fit_tokenizers(titles, ['<start> ' + t + ' <end>' for t in titles])
+        model = build_seq2seq_model(
+            len(input_tokenizer.word_index) + 1,
+            len(target_tokenizer.word_index) + 1,
+            latent_dim=args.latent_dim
+        )
+        decoder = ClickbaitDecoder(
+            model, input_tokenizer, target_tokenizer, max_encoder_len=max_sequence_length(input_tokenizer, titles)
+        )
+
+    headlines = corpus['titulo'].map(clean_text).tolist()[:args.headlines]
+    decoder.generate(headlines[:2], max_length=2)
+    decoder.generate(headlines[:2], method='beam', max_length=2)
+
+    with metrics.timer('seq2seq.greedy_batch'):
+        decoder.generate(headlines, max_length=args.max_length)
+    with metrics.timer('seq2seq.beam_batch'):
+        decoder.generate(headlines, method='beam', max_length=args.max_length)
+    metrics.incr('seq2seq.headlines', len(headlines))
+
+
+STAGES = {
+    'scrapers': bench_scrapers,
+    'clean_text': bench_clean_text,
+    'trigrams': bench_trigrams,
+    'lda_tfidf': bench_lda_tfidf,
+    'seq2seq': bench_seq2seq,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de extremo a extremo: scraping, limpieza y modelos de PLN")
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES))
+    parser.add_argument('--corpus', help="TSV de noticias (p. ej. noticias_unificadas.tsv); por defecto se usan las fixtures")
+    parser.add_argument('--docs', type=int, default=500)
+    parser.add_argument('--days', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.01, help="latencia simulada del servidor stub (s)")
+    parser.add_argument('--sentences', type=int, default=200)
+    parser.add_argument('--lda-passes', type=int, default=2)
+    parser.add_argument('--headlines', type=int, default=64)
+    parser.add_argument('--max-length', type=int, default=20)
+    parser.add_argument('--latent-dim', type=int, default=1024)
+    parser.add_argument('--cprofile', action='store_true')
+    parser.add_argument('--tracemalloc', action='store_true')
+    parser.add_argument('--json', help="guardar las métricas en este archivo")
+    args = parser.parse_args()
+
+    corpus, real_corpus = load_corpus(args)
+    results = {}
+
+    for name in args.stages:
+        metrics = Metrics()
+        kwargs = {'real_corpus': real_corpus} if name == 'lda_tfidf' else {}
+        start = time.perf_counter()
+        try:
+            with profile(cpu=args.cprofile, memory=args.tracemalloc) as profiled:
+                STAGES[name](metrics, args, corpus, **kwargs)
+        except ImportError as e:
+            print(f"\n== {name}: omitido ({e})")
+            continue
+        except LookupError as e:
+            # Recursos de NLTK sin descargar (p. ej. punkt_tab para sent_tokenize)
+            print(f"\n== {name}: omitido (faltan datos de NLTK){e}")
+            continue
+        elapsed = time.perf_counter() - start
+
+        print(f"\n== {name}: {elapsed:.2f}s")
+        print(metrics.report())
+        if profiled.cpu:
+            print(profiled.cpu)
+        if profiled.memory:
+            print(f"Pico de memoria: {profiled.peak_memory / 1024 / 1024:.1f} MB")
+            print("\n".join(profiled.memory))
+
+        results[name] = dict(metrics.snapshot(), elapsed=elapsed, peak_memory=profiled.peak_memory)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,21 @@
 
 import requests
+from requests.adapters import HTTPAdapter
+import csv
+import hashlib
+import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from threading import Lock
+import pandas as pd
 
-def generate_clickbait_ollama(titulo, model="llama3.2:3b", max_retries=3):
+OLLAMA_URL = 'http://localhost:11434/api/generate' #ollama port
+DEFAULT_MODEL = "llama3.2:3b"
 
-    prompt = f"""Convierte este titular de noticia en un clickbait en español.
+
+def build_prompt(titulo):
+    return f"""Convierte este titular de noticia en un clickbait en español.
 El clickbait debe:
 - Ser sensacionalista y crear curiosidad
 - Usar números cuando sea posible
@@ -15,30 +26,204 @@ El clickbait debe:
 Titular original: {titulo}
 
 Responde SOLO con el titular clickbait, sin explicaciones."""
-    
+
+
+def headline_key(titulo, model=DEFAULT_MODEL):
+    return hashlib.sha1(f"{model}\n{titulo}".encode('utf-8')).hexdigest()
+
+
+def generate_clickbait_ollama(titulo, model=DEFAULT_MODEL, max_retries=3, session=None, url=OLLAMA_URL, retry_delay=1, timeout=30):
+    http = session if session is not None else requests
+    prompt = build_prompt(titulo)
+
     for attempt in range(max_retries):
-        response = requests.post(
-            'http://localhost:11434/api/generate', #ollama port
-            json={
-                'model': model,
-                'prompt': prompt,
-                'stream': False,
-                'options': {
-                    'temperature': 0.8,
-                    'top_p': 0.9
-                }
-            },
-            timeout=30
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            clickbait = result['response'].strip() 
-            clickbait = clickbait.strip('"\'\'').strip()
-            if len(clickbait) > 0 and len(clickbait) < 200:
-                return clickbait
-    
+        try:
+            response = http.post(
+                url,
+                json={
+                    'model': model,
+                    'prompt': prompt,
+                    'stream': False,
+                    'options': {
+                        'temperature': 0.8,
+                        'top_p': 0.9
+                    }
+                },
+                timeout=timeout
+            )
+        except requests.exceptions.RequestException:
+            response = None
+
+        if response is not None and response.status_code == 200:
+            try:
+                clickbait = response.json()['response'].strip()
+            except (ValueError, KeyError, AttributeError):
+                # Cuerpo que no es JSON o sin 'response': se trata como un intento fallido
+                clickbait = None
+
+            if clickbait is not None:
+                clickbait = clickbait.strip('"\'\'').strip()
+                if len(clickbait) > 0 and len(clickbait) < 200:
+                    return clickbait
+                # Respuesta válida pero inservible: reintentar sin esperar
+                continue
+
+        if attempt < max_retries - 1:
+            time.sleep(retry_delay * (2 ** attempt))
+
     return None
 
- 
- 
\ No newline at end of file
+
+class ClickbaitDatasetBuilder:
+    def __init__(self, output_file='dataset_clickbaits.csv', cache_file=None, model=DEFAULT_MODEL, url=OLLAMA_URL,
+                 max_workers=4, batch_size=50, max_retries=3, retry_delay=1, timeout=30, verbose=True):
+        self.output_file = output_file
+        self.cache_file = cache_file or f"{os.path.splitext(output_file)[0]}.cache.jsonl"
+        self.model = model
+        self.url = url
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+        self.verbose = verbose
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.write_lock = Lock()
+        self.cache_lock = Lock()
+        self.cache = self._load_cache()
+
+    def _print_progress(self, message):
+        if self.verbose:
+            print(message)
+
+    def _load_cache(self):
+        cache = {}
+        if not os.path.exists(self.cache_file):
+            return cache
+
+        with open(self.cache_file, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Última línea truncada por una interrupción
+                    continue
+                cache[entry['key']] = entry['clickbait']
+        return cache
+
+    def _store_cache(self, titulo, clickbait):
+        key = headline_key(titulo, self.model)
+        with self.cache_lock:
+            self.cache[key] = clickbait
+            with open(self.cache_file, 'a', encoding='utf-8') as file:
+                file.write(json.dumps({'key': key, 'clickbait': clickbait}, ensure_ascii=False) + "\n")
+
+    def _get_existing_titles(self):
+        if not os.path.exists(self.output_file) or os.path.getsize(self.output_file) == 0:
+            return set()
+
+        df = pd.read_csv(self.output_file, encoding='utf-8', usecols=['titulo_limpio'])
+        return set(df['titulo_limpio'].tolist())
+
+    def _flush(self, rows):
+        if not rows:
+            return
+
+        with self.write_lock:
+            write_header = not os.path.exists(self.output_file) or os.path.getsize(self.output_file) == 0
+            with open(self.output_file, 'a', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                if write_header:
+                    writer.writerow(['titulo_limpio', 'clickbait'])
+                writer.writerows(rows)
+                file.flush()
+                os.fsync(file.fileno())
+        rows.clear()
+
+    def generate(self, titulo):
+        cached = self.cache.get(headline_key(titulo, self.model))
+        if cached is not None:
+            return cached
+
+        clickbait = generate_clickbait_ollama(
+            titulo,
+            model=self.model,
+            max_retries=self.max_retries,
+            session=self.session,
+            url=self.url,
+            retry_delay=self.retry_delay,
+            timeout=self.timeout
+        )
+        if clickbait is not None:
+            self._store_cache(titulo, clickbait)
+        return clickbait
+
+    def load(self):
+        if not os.path.exists(self.output_file) or os.path.getsize(self.output_file) == 0:
+            return pd.DataFrame(columns=['titulo_limpio', 'clickbait'])
+        return pd.read_csv(self.output_file, encoding='utf-8')
+
+    def build(self, titulos, limit=None):
+        # El lote objetivo se fija antes de descartar lo ya escrito: al reanudar se completa el mismo lote
+        target = list(dict.fromkeys(titulos))
+        if limit is not None:
+            target = target[:limit]
+
+        existing_titles = self._get_existing_titles()
+        pending = [t for t in target if t not in existing_titles]
+
+        total = len(pending)
+        if total == 0:
+            self._print_progress("No hay titulares nuevos para procesar")
+            return self.load()
+
+        self._print_progress(f"Procesando {total} titulares con {self.max_workers} workers...")
+
+        buffer = []
+        done = 0
+        failed = 0
+        start = time.perf_counter()
+        titles = iter(pending)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        in_flight = {}
+
+        try:
+            # Mantener como máximo 2 * max_workers peticiones en vuelo
+            for titulo in titles:
+                in_flight[executor.submit(self.generate, titulo)] = titulo
+                if len(in_flight) >= 2 * self.max_workers:
+                    break
+
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    titulo = in_flight.pop(future)
+                    clickbait = future.result()
+                    done += 1
+                    if clickbait is None:
+                        failed += 1
+                    else:
+                        buffer.append([titulo, clickbait])
+
+                    next_titulo = next(titles, None)
+                    if next_titulo is not None:
+                        in_flight[executor.submit(self.generate, next_titulo)] = next_titulo
+
+                if len(buffer) >= self.batch_size:
+                    self._flush(buffer)
+                    elapsed = time.perf_counter() - start
+                    self._print_progress(f"Progreso: {done}/{total} | Fallidos: {failed} | {done / elapsed:.1f} titulares/s")
+        except KeyboardInterrupt:
+            self._print_progress(f"\n⏸Proceso interrumpido por el usuario. Puedes reanudar ejecutando nuevamente")
+            for future in in_flight:
+                future.cancel()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._flush(buffer)
+
+        elapsed = time.perf_counter() - start
+        self._print_progress(f"\nProceso completado: {done - failed}/{total} clickbaits en {elapsed:.1f}s ({failed} fallidos)")
+        return self.load()
@@ -0,0 +1,220 @@
+import os
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+
+from seq2seq_model import (
+    MODEL_FILE,
+    INPUT_TOKENIZER_FILE,
+    TARGET_TOKENIZER_FILE,
+    TOKENIZER_METADATA_FILE,
+    load_seq2seq_model,
+    load_or_fit_tokenizers,
+    load_tokenizer,
+    load_tokenizer_metadata
+)
+
+DATASET_FILE = 'dataset_clickbaits.csv'
+EMPTY_RESULT = "[El modelo no pudo generar un clickbait]"
+
+
+def training_texts_from_dataset(dataset_file=DATASET_FILE):
+    # Reproduce el split del notebook parte_2_5 para recuperar el mismo vocabulario
+    from sklearn.model_selection import train_test_split
+
+    df = pd.read_csv(dataset_file, encoding='utf-8')
+    df['input_text'] = df['titulo_limpio']
+    df['target_text'] = '<start> ' + df['clickbait'] + ' <end>'
+    train_df, _ = train_test_split(df, test_size=0.1, random_state=42)
+    return train_df['input_text'], train_df['target_text']
+
+
+class ClickbaitDecoder:
+    def __init__(self, model, input_tokenizer, target_tokenizer, max_encoder_len=None):
+        self.model = model
+        self.input_tokenizer = input_tokenizer
+        self.target_tokenizer = target_tokenizer
+
+        self.encoder_embedding = model.get_layer('encoder_embedding')
+        self.encoder_lstm = model.get_layer('encoder_lstm')
+        self.decoder_embedding = model.get_layer('decoder_embedding')
+        self.decoder_lstm = model.get_layer('decoder_lstm')
+        self.decoder_dense = model.get_layer('decoder_dense')
+
+        # Con entradas de longitud variable el modelo no fija un máximo: se usa el de entrenamiento para truncar
+        # igual que generate_clickbait del notebook
+        self.max_encoder_len = max_encoder_len or model.inputs[0].shape[1]
+        self.latent_dim = self.encoder_lstm.units
+
+        input_vocab_size = len(input_tokenizer.word_index) + 1
+        target_vocab_size = len(target_tokenizer.word_index) + 1
+        if input_vocab_size != self.encoder_embedding.input_dim or target_vocab_size != self.decoder_embedding.input_dim:
+            raise ValueError(
+                f"Los tokenizers ({input_vocab_size}, {target_vocab_size}) no corresponden al modelo "
+                f"({self.encoder_embedding.input_dim}, {self.decoder_embedding.input_dim})"
+            )
+
+        self.start_token = target_tokenizer.word_index.get('<start>', 1)
+        self.end_token = target_tokenizer.word_index.get('<end>')
+        self.index_to_word = {index: word for word, index in target_tokenizer.word_index.items()}
+
+        self._encode = tf.function(
+            self._encode_step,
+            input_signature=[tf.TensorSpec([None, None], tf.int32)]
+        )
+        self._decode = tf.function(
+            self._decode_step,
+            input_signature=[
+                tf.TensorSpec([None], tf.int32),
+                tf.TensorSpec([None, self.latent_dim], tf.float32),
+                tf.TensorSpec([None, self.latent_dim], tf.float32)
+            ]
+        )
+
+    @classmethod
+    def from_files(cls, model_file=MODEL_FILE, input_tokenizer_file=INPUT_TOKENIZER_FILE,
+                   target_tokenizer_file=TARGET_TOKENIZER_FILE, metadata_file=TOKENIZER_METADATA_FILE,
+                   dataset_file=DATASET_FILE):
+        model = load_seq2seq_model(model_file)
+
+        if os.path.exists(input_tokenizer_file) and os.path.exists(target_tokenizer_file):
+            input_tokenizer = load_tokenizer(input_tokenizer_file)
+            target_tokenizer = load_tokenizer(target_tokenizer_file)
+        else:
+            input_tokenizer, target_tokenizer = load_or_fit_tokenizers(
+                *training_texts_from_dataset(dataset_file),
+                input_tokenizer_file=input_tokenizer_file,
+                target_tokenizer_file=target_tokenizer_file,
+                metadata_file=metadata_file,
+                refit=True
+            )
+        max_encoder_len = load_tokenizer_metadata(metadata_file).get('max_encoder_len')
+        return cls(model, input_tokenizer, target_tokenizer, max_encoder_len=max_encoder_len)
+
+    def _encode_step(self, encoder_input):
+        embedded = self.encoder_embedding(encoder_input)
+        mask = tf.not_equal(encoder_input, 0)
+        _, state_h, state_c = self.encoder_lstm(embedded, mask=mask)
+        return state_h, state_c
+
+    def _decode_step(self, tokens, state_h, state_c):
+        embedded = self.decoder_embedding(tokens[:, None])
+        outputs, state_h, state_c = self.decoder_lstm(embedded, initial_state=[state_h, state_c])
+        probs = self.decoder_dense(outputs[:, -1, :])
+        return probs, state_h, state_c
+
+    def _prepare_inputs(self, headlines):
+        sequences = self.input_tokenizer.texts_to_sequences(headlines)
+        # Padding dinámico: la máscara hace irrelevante el relleno más allá del titular más largo
+        length = max(1, min(self.max_encoder_len or np.inf, max(len(seq) for seq in sequences)))
+        batch = np.zeros((len(sequences), length), dtype=np.int32)
+        for i, seq in enumerate(sequences):
+            # Igual que pad_sequences: los titulares demasiado largos se truncan por el inicio
+            seq = seq[-length:] if seq else seq
+            batch[i, :len(seq)] = seq
+        return batch
+
+    def _to_text(self, token_ids):
+        words = []
+        for token in token_ids:
+            if token == 0 or token == self.end_token:
+                break
+            if token == self.start_token:
+                continue
+            words.append(self.index_to_word.get(int(token), ''))
+        result = ' '.join(word for word in words if word)
+        return result if result else EMPTY_RESULT
+
+    def greedy(self, headlines, max_length=50, max_steps=None):
+        state_h, state_c = self._encode(tf.constant(self._prepare_inputs(headlines)))
+        batch_size = len(headlines)
+
+        tokens = np.full(batch_size, self.start_token, dtype=np.int32)
+        finished = np.zeros(batch_size, dtype=bool)
+        outputs = np.zeros((batch_size, max_length), dtype=np.int32)
+        lengths = np.zeros(batch_size, dtype=np.int32)
+
+        # Como en el notebook, max_length cuenta palabras emitidas: los <start> generados no suman.
+        # El tope de pasos solo evita un bucle infinito si el modelo emite <start> indefinidamente
+        for _ in range(max_steps or max_length + 100):
+            probs, state_h, state_c = self._decode(tf.constant(tokens), state_h, state_c)
+            tokens = np.argmax(probs.numpy(), axis=-1).astype(np.int32)
+            tokens[finished] = 0
+            finished |= (tokens == 0) | (tokens == self.end_token)
+
+            emit = ~finished & (tokens != self.start_token)
+            rows = np.nonzero(emit)[0]
+            outputs[rows, lengths[rows]] = tokens[rows]
+            lengths += emit
+            finished |= lengths >= max_length
+            if finished.all():
+                break
+
+        return [self._to_text(row) for row in outputs]
+
+    def beam_search(self, headlines, beam_width=3, max_length=50, length_penalty=0.7, max_steps=None):
+        state_h, state_c = self._encode(tf.constant(self._prepare_inputs(headlines)))
+        batch_size = len(headlines)
+        flat_size = batch_size * beam_width
+
+        # Cada titular ocupa beam_width filas consecutivas
+        state_h = tf.repeat(state_h, beam_width, axis=0)
+        state_c = tf.repeat(state_c, beam_width, axis=0)
+
+        tokens = np.full(flat_size, self.start_token, dtype=np.int32)
+        scores = np.full((batch_size, beam_width), -np.inf, dtype=np.float32)
+        scores[:, 0] = 0.0
+        lengths = np.zeros((batch_size, beam_width), dtype=np.int32)
+        finished = np.zeros((batch_size, beam_width), dtype=bool)
+        sequences = np.zeros((batch_size, beam_width, max_length), dtype=np.int32)
+
+        # Mismas reglas que greedy: el relleno (0) y <end> cierran el haz y <start> no cuenta como palabra,
+        # así que con beam_width=1 el resultado es idéntico al de greedy
+        for _ in range(max_steps or max_length + 100):
+            probs, state_h, state_c = self._decode(tf.constant(tokens), state_h, state_c)
+            log_probs = np.log(np.maximum(probs.numpy(), 1e-12)).reshape(batch_size, beam_width, -1)
+
+            # Los haces terminados solo pueden extenderse con relleno y sin coste
+            log_probs[finished] = -np.inf
+            log_probs[finished, 0] = 0.0
+
+            vocab_size = log_probs.shape[-1]
+            candidates = (scores[:, :, None] + log_probs).reshape(batch_size, -1)
+            top = np.argpartition(-candidates, beam_width - 1, axis=-1)[:, :beam_width]
+            scores = np.take_along_axis(candidates, top, axis=-1)
+            beam_ids = top // vocab_size
+            tokens = (top % vocab_size).astype(np.int32)
+
+            rows = np.arange(batch_size)[:, None]
+            sequences = sequences[rows, beam_ids]
+            lengths = lengths[rows, beam_ids]
+            finished = finished[rows, beam_ids]
+
+            stop = (tokens == 0) | (tokens == self.end_token)
+            emit = ~finished & ~stop & (tokens != self.start_token)
+            batch_ids, beam_pos = np.nonzero(emit)
+            sequences[batch_ids, beam_pos, lengths[batch_ids, beam_pos]] = tokens[batch_ids, beam_pos]
+            lengths += emit
+            finished |= stop | (lengths >= max_length)
+
+            gather = (rows * beam_width + beam_ids).reshape(-1)
+            state_h = tf.gather(state_h, gather)
+            state_c = tf.gather(state_c, gather)
+            tokens = np.where(finished, 0, tokens).reshape(-1).astype(np.int32)
+
+            if finished.all():
+                break
+
+        normalized = scores / np.maximum(lengths, 1) ** length_penalty
+        best = np.argmax(normalized, axis=-1)
+        return [self._to_text(sequences[i, best[i]]) for i in range(batch_size)]
+
+    def generate(self, headlines, method='greedy', batch_size=64, **kwargs):
+        if method not in ('greedy', 'beam'):
+            raise ValueError(f"Método de decodificación desconocido: {method}")
+
+        decode = self.greedy if method == 'greedy' else self.beam_search
+        results = []
+        for start in range(0, len(headlines), batch_size):
+            results.extend(decode(list(headlines[start:start + batch_size]), **kwargs))
+        return results
@@ -0,0 +1,2 @@
+# Los tests y benchmarks importan los módulos de la raíz (scrapper, clickbait_decoder, benchmarks...):
+# este conftest hace que pytest añada la raíz del repositorio al sys.path también con `pytest` a secas
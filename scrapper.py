@@ -11,10 +11,11 @@ import sys
 import time
 import os
 import pandas as pd
+from utils.metrics import Metrics, ProgressReporter
 
 
 class NewsScrapper:
-    def __init__(self, max_workers=10, verbose=True, max_retries=3, retry_delay=5):
+    def __init__(self, max_workers=10, verbose=True, max_retries=3, retry_delay=5, metrics=None, progress_interval=1.0):
         self.base_url = "https://diariocorreo.pe"
         self.session = requests.Session()
         self.session.headers.update({
@@ -26,6 +27,8 @@ class NewsScrapper:
         self.is_jupyter = self._is_jupyter()
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.progress = ProgressReporter(verbose=verbose, interval=progress_interval, is_jupyter=self.is_jupyter)
     
     def _is_jupyter(self):
         try:
@@ -38,16 +41,21 @@ class NewsScrapper:
         if not self.verbose:
             return
         
-        if self.is_jupyter and overwrite:
-            try:
-                from IPython.display import clear_output
-                clear_output(wait=True)
-                print(message)
-            except:
-                print(message)
+        if overwrite:
+            self.progress.update(message)
         else:
+            self.progress.flush()
             print(message)
     
+    def _fetch(self, url, metric):
+        # Se cuenta antes de la llamada para incluir también los errores de conexión y timeouts
+        self.metrics.incr('http.requests')
+        with self.metrics.timer(metric):
+            response = self.session.get(url, timeout=10)
+        self.metrics.incr('http.bytes', len(response.content))
+        response.raise_for_status()
+        return response
+    
     def clean_text(self, text):
         if not text:
             return ""
@@ -61,7 +69,9 @@ class NewsScrapper:
             try:
                 return func(*args, **kwargs)
             except requests.exceptions.RequestException as e:
+                self.metrics.incr('http.errors')
                 if attempt < self.max_retries - 1:
+                    self.metrics.incr('http.retries')
                     wait_time = self.retry_delay * (2 ** attempt)
                     self._print_progress(f"Error de conexión (intento {attempt + 1}/{self.max_retries}). Esperando {wait_time}s...")
                     time.sleep(wait_time)
@@ -106,8 +116,7 @@ class NewsScrapper:
         url = f"{self.base_url}/archivo/todas/{date.strftime('%Y-%m-%d')}/"
         
         def fetch_news():
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            response = self._fetch(url, 'http.news_list')
             soup = BeautifulSoup(response.content, 'lxml')
             
             news_items = []
@@ -135,7 +144,8 @@ class NewsScrapper:
             return news_items
         
         try:
-            return self._retry_request(fetch_news)
+            with self.metrics.timer('news_list'):
+                return self._retry_request(fetch_news)
         except requests.exceptions.RequestException:
             return None
         except Exception:
@@ -143,8 +153,7 @@ class NewsScrapper:
     
     def get_article_content(self, url):
         def fetch_content():
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            response = self._fetch(url, 'http.article')
             soup = BeautifulSoup(response.content, 'lxml')
             content_div = soup.find('div', class_='story-contents__content')
             if content_div:
@@ -154,12 +163,14 @@ class NewsScrapper:
             return ""
         
         try:
-            return self._retry_request(fetch_content)
+            with self.metrics.timer('article'):
+                return self._retry_request(fetch_content)
         except Exception:
             return ""
     
     def process_article(self, news, output_file):
         content = self.get_article_content(news['url'])
+        self.metrics.incr('articles.saved' if content else 'articles.empty')
         if content:
             with self.write_lock:
                 with open(output_file, 'a', newline='', encoding='utf-8') as file:
@@ -207,7 +218,7 @@ class NewsScrapper:
                 if not news_list:
                     empty_attempts += 1
                     if empty_attempts >= max_empty_attempts:
-                        self._print_progress(f"Finalizando. No hay más noticias disponibles.", overwrite=True)
+                        self._print_progress(f"Finalizando. No hay más noticias disponibles.")
                 else:
                     empty_attempts = 0
                     successful = 0
@@ -0,0 +1,73 @@
+import numpy as np
+import tensorflow as tf
+
+AUTOTUNE = tf.data.AUTOTUNE
+
+
+def to_sequences(input_texts, target_texts, input_tokenizer, target_tokenizer):
+    encoder_sequences = input_tokenizer.texts_to_sequences(list(input_texts))
+    decoder_sequences = target_tokenizer.texts_to_sequences(list(target_texts))
+    return encoder_sequences, decoder_sequences
+
+
+def bucket_boundaries_for(lengths, num_buckets=6):
+    if len(lengths) == 0:
+        return []
+
+    # Límites por cuantiles para que cada bucket reciba un número parecido de ejemplos
+    quantiles = np.linspace(0, 100, num_buckets + 1)[1:-1]
+    boundaries = np.unique(np.percentile(lengths, quantiles).astype(int) + 1)
+    return [int(b) for b in boundaries if b > 1]
+
+
+def _shift_targets(encoder_input, decoder_input):
+    # Igual que en el notebook: la salida es la entrada del decoder desplazada una posición, con 0 al final
+    decoder_output = tf.concat([decoder_input[1:], tf.zeros([1], dtype=decoder_input.dtype)], axis=0)
+    return (encoder_input, decoder_input), decoder_output
+
+
+def _element_length(inputs, decoder_output):
+    encoder_input, decoder_input = inputs
+    return tf.maximum(tf.shape(encoder_input)[0], tf.shape(decoder_input)[0])
+
+
+def make_dataset(encoder_sequences, decoder_sequences, batch_size=64, shuffle=True, bucket_boundaries=None,
+                 num_buckets=6, seed=42):
+    lengths = [max(len(e), len(d)) for e, d in zip(encoder_sequences, decoder_sequences)]
+    if bucket_boundaries is None:
+        bucket_boundaries = bucket_boundaries_for(lengths, num_buckets)
+
+    dataset = tf.data.Dataset.from_tensor_slices((
+        tf.ragged.constant(encoder_sequences, dtype=tf.int32),
+        tf.ragged.constant(decoder_sequences, dtype=tf.int32)
+    ))
+    dataset = dataset.map(_shift_targets, num_parallel_calls=AUTOTUNE).cache()
+
+    if shuffle:
+        dataset = dataset.shuffle(len(lengths), seed=seed, reshuffle_each_iteration=True)
+
+    # Cada lote se rellena solo hasta la secuencia más larga de su bucket
+    dataset = dataset.bucket_by_sequence_length(
+        element_length_func=_element_length,
+        bucket_boundaries=bucket_boundaries,
+        bucket_batch_sizes=[batch_size] * (len(bucket_boundaries) + 1),
+        pad_to_bucket_boundary=False
+    )
+    if shuffle:
+        dataset = dataset.shuffle(64, seed=seed, reshuffle_each_iteration=True)
+    return dataset.prefetch(AUTOTUNE)
+
+
+def make_train_val_datasets(input_texts, target_texts, input_tokenizer, target_tokenizer, batch_size=64,
+                            validation_split=0.1, **kwargs):
+    encoder_sequences, decoder_sequences = to_sequences(input_texts, target_texts, input_tokenizer, target_tokenizer)
+
+    # Como validation_split de model.fit: la validación es la última fracción, sin barajar
+    split = len(encoder_sequences) - int(len(encoder_sequences) * validation_split)
+    train_ds = make_dataset(encoder_sequences[:split], decoder_sequences[:split], batch_size=batch_size, **kwargs)
+
+    # validation_split=0 o muy pocos ejemplos: sin validación (model.fit acepta validation_data=None)
+    if split == len(encoder_sequences):
+        return train_ds, None
+    val_ds = make_dataset(encoder_sequences[split:], decoder_sequences[split:], batch_size=batch_size, shuffle=False)
+    return train_ds, val_ds
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import h5py
+from tensorflow import keras
+from tensorflow.keras.models import Model
+from tensorflow.keras.layers import Input, LSTM, Dense, Embedding
+from tensorflow.keras.preprocessing.text import Tokenizer, tokenizer_from_json
+
+MODEL_FILE = 'models/seq2seq_clickbait_generator.h5'
+INPUT_TOKENIZER_FILE = 'models/input_tokenizer.json'
+TARGET_TOKENIZER_FILE = 'models/target_tokenizer.json'
+TOKENIZER_METADATA_FILE = 'models/tokenizers_meta.json'
+
+
+def build_seq2seq_model(input_vocab_size, target_vocab_size, max_encoder_len=None, max_decoder_len=None,
+                        embedding_dim=512, latent_dim=1024):
+    # Encoder
+    encoder_inputs = Input(shape=(max_encoder_len,), name='encoder_input')
+    encoder_embedding = Embedding(
+        input_vocab_size,
+        embedding_dim,
+        mask_zero=True,
+        name='encoder_embedding'
+    )(encoder_inputs)
+    encoder_lstm = LSTM(
+        latent_dim,
+        return_state=True,
+        name='encoder_lstm'
+    )
+    _, state_h, state_c = encoder_lstm(encoder_embedding)
+
+    # Decoder
+    decoder_inputs = Input(shape=(max_decoder_len,), name='decoder_input')
+    decoder_embedding = Embedding(
+        target_vocab_size,
+        embedding_dim,
+        mask_zero=True,
+        name='decoder_embedding'
+    )(decoder_inputs)
+    decoder_lstm = LSTM(
+        latent_dim,
+        return_sequences=True,
+        return_state=True,
+        name='decoder_lstm'
+    )
+    decoder_outputs, _, _ = decoder_lstm(decoder_embedding, initial_state=[state_h, state_c])
+    decoder_dense = Dense(
+        target_vocab_size,
+        activation='softmax',
+        name='decoder_dense'
+    )
+    decoder_outputs = decoder_dense(decoder_outputs)
+
+    return Model([encoder_inputs, decoder_inputs], decoder_outputs)
+
+
+def load_seq2seq_model(model_file=MODEL_FILE):
+    try:
+        return keras.models.load_model(model_file, compile=False)
+    except ValueError:
+        # Keras 3 guarda la máscara de Embedding como una capa 'NotEqual' que luego no sabe cargar:
+        # se reconstruye la arquitectura a partir de la configuración y se cargan solo los pesos
+        with h5py.File(model_file, 'r') as file:
+            config = json.loads(file.attrs['model_config'])
+
+        layers = {layer['config']['name']: layer['config'] for layer in config['config']['layers']}
+
+        def input_len(name):
+            shape = layers[name].get('batch_shape') or layers[name].get('batch_input_shape')
+            return shape[1]
+
+        model = build_seq2seq_model(
+            layers['encoder_embedding']['input_dim'],
+            layers['decoder_embedding']['input_dim'],
+            max_encoder_len=input_len('encoder_input'),
+            max_decoder_len=input_len('decoder_input'),
+            embedding_dim=layers['encoder_embedding']['output_dim'],
+            latent_dim=layers['encoder_lstm']['units']
+        )
+        model.load_weights(model_file)
+        return model
+
+
+def save_tokenizer(tokenizer, path):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(tokenizer.to_json())
+
+
+def load_tokenizer(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        return tokenizer_from_json(file.read())
+
+
+def fit_tokenizers(input_texts, target_texts):
+    input_tokenizer = Tokenizer(filters='', lower=True)
+    input_tokenizer.fit_on_texts(input_texts)
+
+    target_tokenizer = Tokenizer(filters='', lower=True)
+    target_tokenizer.fit_on_texts(target_texts)
+    return input_tokenizer, target_tokenizer
+
+
+def texts_fingerprint(input_texts, target_texts):
+    digest = hashlib.sha1()
+    for texts in (input_texts, target_texts):
+        digest.update("\n".join(texts).encode('utf-8'))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def max_sequence_length(tokenizer, texts):
+    return max((len(seq) for seq in tokenizer.texts_to_sequences(list(texts))), default=0)
+
+
+def load_tokenizer_metadata(metadata_file=TOKENIZER_METADATA_FILE):
+    if not os.path.exists(metadata_file):
+        return {}
+    with open(metadata_file, 'r', encoding='utf-8') as file:
+        try:
+            return json.load(file)
+        except json.JSONDecodeError:
+            return {}
+
+
+def load_or_fit_tokenizers(input_texts, target_texts, input_tokenizer_file=INPUT_TOKENIZER_FILE,
+                           target_tokenizer_file=TARGET_TOKENIZER_FILE, metadata_file=TOKENIZER_METADATA_FILE,
+                           refit=False):
+    input_texts, target_texts = list(input_texts), list(target_texts)
+    fingerprint = texts_fingerprint(input_texts, target_texts)
+
+    # Solo se reutiliza el vocabulario guardado si se ajustó sobre exactamente los mismos textos
+    if not refit and os.path.exists(input_tokenizer_file) and os.path.exists(target_tokenizer_file):
+        if load_tokenizer_metadata(metadata_file).get('fingerprint') == fingerprint:
+            return load_tokenizer(input_tokenizer_file), load_tokenizer(target_tokenizer_file)
+
+    input_tokenizer, target_tokenizer = fit_tokenizers(input_texts, target_texts)
+    save_tokenizer(input_tokenizer, input_tokenizer_file)
+    save_tokenizer(target_tokenizer, target_tokenizer_file)
+
+    # max_encoder_len: en inferencia los titulares más largos que los de entrenamiento se truncan a esta longitud
+    with open(metadata_file, 'w', encoding='utf-8') as file:
+        json.dump({
+            'fingerprint': fingerprint,
+            'max_encoder_len': max_sequence_length(input_tokenizer, input_texts)
+        }, file)
+    return input_tokenizer, target_tokenizer
@@ -0,0 +1,59 @@
+import pytest
+
+from benchmarks.ollama_stub_server import start_stub_server
+from clickbait_dataset_builder import ClickbaitDatasetBuilder
+
+
+class InterruptingBuilder(ClickbaitDatasetBuilder):
+    def __init__(self, interrupt_after, **kwargs):
+        super().__init__(**kwargs)
+        self.interrupt_after = interrupt_after
+        self.calls = 0
+
+    def generate(self, titulo):
+        self.calls += 1
+        if self.calls > self.interrupt_after:
+            raise KeyboardInterrupt
+        return super().generate(titulo)
+
+
+@pytest.fixture
+def stub_url():
+    server, url = start_stub_server(latency=0.0)
+    yield url
+    server.shutdown()
+
+
+def test_build_resumes_interrupted_batch(tmp_path, stub_url):
+    output_file = str(tmp_path / 'dataset.csv')
+    titles = [f"titular de prueba {i}" for i in range(60)]
+
+    interrupted = InterruptingBuilder(
+        interrupt_after=12, output_file=output_file, url=stub_url, max_workers=2, batch_size=5, verbose=False
+    )
+    partial = interrupted.build(titles, limit=30)
+    assert 0 < len(partial) < 30
+
+    resumed = ClickbaitDatasetBuilder(output_file=output_file, url=stub_url, max_workers=2, batch_size=5, verbose=False)
+    df = resumed.build(titles, limit=30)
+    assert sorted(df['titulo_limpio']) == sorted(titles[:30])
+
+    # Volver a ejecutar con el lote completo no añade filas
+    df = resumed.build(titles, limit=30)
+    assert len(df) == 30
+
+
+def test_build_survives_malformed_replies(tmp_path):
+    server, url = start_stub_server(latency=0.0, malformed_rate=0.5)
+    try:
+        builder = ClickbaitDatasetBuilder(
+            output_file=str(tmp_path / 'dataset.csv'), url=url, max_workers=4, batch_size=5, retry_delay=0.001, verbose=False
+        )
+        titles = [f"titular de prueba {i}" for i in range(40)]
+        df = builder.build(titles)
+    finally:
+        server.shutdown()
+
+    # Los titulares que agotan los reintentos quedan fuera; el resto se escribe sin abortar la construcción
+    assert 0 < len(df) <= len(titles)
+    assert set(df['titulo_limpio']) <= set(titles)
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from benchmarks.bench_seq2seq_decoding import build_legacy_models, legacy_generate
+from clickbait_decoder import ClickbaitDecoder, EMPTY_RESULT
+from seq2seq_model import build_seq2seq_model, fit_tokenizers, load_or_fit_tokenizers
+
+WORDS = [f"w{i}" for i in range(40)]
+
+
+@pytest.fixture(scope='module')
+def texts():
+    rng = np.random.default_rng(0)
+    headlines = [' '.join(rng.choice(WORDS, rng.integers(3, 10))) for _ in range(10)]
+    targets = ['<start> ' + ' '.join(rng.choice(WORDS, 6)) + ' <end>' for _ in range(30)]
+    return headlines, targets
+
+
+def build_model(input_tokenizer, target_tokenizer, seed):
+    tf.keras.utils.set_random_seed(seed)
+    return build_seq2seq_model(
+        len(input_tokenizer.word_index) + 1,
+        len(target_tokenizer.word_index) + 1,
+        embedding_dim=16,
+        latent_dim=32
+    )
+
+
+def build_decoder(texts, seed, max_encoder_len=None):
+    input_tokenizer, target_tokenizer = fit_tokenizers(*texts)
+    model = build_model(input_tokenizer, target_tokenizer, seed)
+    return ClickbaitDecoder(model, input_tokenizer, target_tokenizer, max_encoder_len=max_encoder_len)
+
+
+# Con la semilla 2 el modelo emite varios <start> seguidos: greedy debe saltarlos sin contarlos, como el notebook.
+# El bucle del notebook no tiene tope de pasos, por eso se fijan semillas con las que termina
+@pytest.mark.parametrize('seed', [0, 2])
+def test_greedy_matches_notebook_loop(texts, seed):
+    decoder = build_decoder(texts, seed)
+    encoder_model, decoder_model = build_legacy_models(decoder)
+    headlines = texts[0]
+
+    for max_length in (3, 8):
+        expected = [
+            legacy_generate(decoder, encoder_model, decoder_model, h, max_length) or EMPTY_RESULT
+            for h in headlines
+        ]
+        assert decoder.greedy(headlines, max_length=max_length) == expected
+
+
+def test_batch_matches_single_headlines(texts):
+    decoder = build_decoder(texts, 1)
+    headlines = texts[0]
+
+    # Titulares de distinta longitud en el mismo lote: el relleno dinámico no debe cambiar el resultado
+    assert decoder.greedy(headlines, max_length=8) == [decoder.greedy([h], max_length=8)[0] for h in headlines]
+    assert decoder.beam_search(headlines, max_length=8) == [
+        decoder.beam_search([h], max_length=8)[0] for h in headlines
+    ]
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_beam_width_one_matches_greedy(texts, seed):
+    decoder = build_decoder(texts, seed)
+    headlines = texts[0]
+    assert decoder.beam_search(headlines, beam_width=1, max_length=8) == decoder.greedy(headlines, max_length=8)
+
+
+def test_beam_search_respects_max_length(texts):
+    decoder = build_decoder(texts, 0)
+    for result in decoder.beam_search(texts[0], beam_width=4, max_length=5):
+        assert result == EMPTY_RESULT or len(result.split()) <= 5
+
+
+@pytest.mark.parametrize('stop_token', ['<end>', 'padding'])
+def test_beam_search_stops_finished_beams(texts, stop_token):
+    decoder = build_decoder(texts, 0)
+    token = decoder.end_token if stop_token == '<end>' else 0
+
+    # Sesgo enorme hacia el token de parada: todos los haces terminan en el primer paso
+    bias = np.zeros(decoder.decoder_dense.units, dtype=np.float32)
+    bias[token] = 100.0
+    decoder.decoder_dense.bias.assign(bias)
+
+    assert decoder.greedy(texts[0], max_length=8) == [EMPTY_RESULT] * len(texts[0])
+    for beam_width in (1, 3):
+        assert decoder.beam_search(texts[0], beam_width=beam_width, max_length=8) == [EMPTY_RESULT] * len(texts[0])
+
+
+def test_long_headlines_are_truncated_like_the_notebook(texts):
+    decoder = build_decoder(texts, 0, max_encoder_len=4)
+    encoder_model, decoder_model = build_legacy_models(decoder)
+    words = list(decoder.input_tokenizer.word_index)[:12]
+    headline = ' '.join(words)
+
+    # Como pad_sequences en generate_clickbait: se conservan las últimas max_encoder_len palabras
+    assert decoder._prepare_inputs([headline]).tolist() == decoder.input_tokenizer.texts_to_sequences([' '.join(words[-4:])])
+    assert decoder.greedy([headline], max_length=8) == decoder.greedy([' '.join(words[-4:])], max_length=8)
+    expected = legacy_generate(decoder, encoder_model, decoder_model, headline, 8) or EMPTY_RESULT
+    assert decoder.greedy([headline], max_length=8) == [expected]
+
+
+def test_from_files_restores_training_max_encoder_len(texts, tmp_path):
+    files = dict(
+        input_tokenizer_file=str(tmp_path / 'input.json'),
+        target_tokenizer_file=str(tmp_path / 'target.json'),
+        metadata_file=str(tmp_path / 'tokenizers_meta.json')
+    )
+    input_tokenizer, target_tokenizer = load_or_fit_tokenizers(*texts, **files)
+    model_file = str(tmp_path / 'model.h5')
+    build_model(input_tokenizer, target_tokenizer, 0).save(model_file)
+
+    decoder = ClickbaitDecoder.from_files(model_file=model_file, **files)
+    assert decoder.model.inputs[0].shape[1] is None
+    assert decoder.max_encoder_len == max(len(h.split()) for h in texts[0])
@@ -0,0 +1,112 @@
+import pytest
+
+from utils import metrics as metrics_module
+from utils.metrics import Histogram, Metrics, ProgressReporter
+
+
+def test_percentiles_of_uniform_distribution():
+    hist = Histogram(buckets=[10, 20, 30, 40, 50, 60, 70, 80, 90, 100])
+    for value in range(1, 101):
+        hist.observe(value)
+
+    assert hist.percentile(50) == pytest.approx(50)
+    assert hist.percentile(90) == pytest.approx(90)
+    assert hist.percentile(99) == pytest.approx(99)
+    summary = hist.summary()
+    assert summary['count'] == 100
+    assert summary['mean'] == pytest.approx(50.5)
+    assert (summary['min'], summary['max']) == (1, 100)
+
+
+def test_percentiles_outside_the_buckets_are_clamped_to_observed_values():
+    hist = Histogram(buckets=[1, 2, 4])
+    for value in [0.5, 1.5, 3, 10]:
+        hist.observe(value)
+
+    # Bucket inferior: se interpola desde el mínimo observado; bucket superior: hasta el máximo
+    assert hist.percentile(0) == pytest.approx(0.5)
+    assert hist.percentile(25) == pytest.approx(1.0)
+    assert hist.percentile(100) == pytest.approx(10)
+
+    below = Histogram(buckets=[1, 2])
+    below.observe(0.2)
+    above = Histogram(buckets=[1, 2])
+    above.observe(5)
+    for q in (0, 50, 99):
+        assert below.percentile(q) == pytest.approx(0.2)
+        assert above.percentile(q) == pytest.approx(5)
+
+
+def test_empty_histogram():
+    hist = Histogram()
+    assert hist.percentile(50) == 0.0
+    assert hist.summary()['min'] == 0.0
+
+
+def test_merge_with_prefix():
+    site = Metrics()
+    site.incr('http.requests', 3)
+    site.observe('article', 0.002)
+    site.observe('article', 0.5)
+
+    total = Metrics()
+    total.incr('http.requests')
+    total.observe('diariocorreo.article', 0.1)
+    total.merge(site, prefix='diariocorreo.')
+
+    snapshot = total.snapshot()
+    assert snapshot['counters'] == {'http.requests': 1, 'diariocorreo.http.requests': 3}
+    article = snapshot['latencies']['diariocorreo.article']
+    assert article['count'] == 3
+    assert article['total'] == pytest.approx(0.602)
+    assert (article['min'], article['max']) == (0.002, 0.5)
+
+    # Sin prefijo se acumula sobre los mismos nombres y el origen no cambia
+    total.merge(site)
+    assert total.counters['http.requests'] == 4
+    assert site.snapshot()['counters'] == {'http.requests': 3}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(metrics_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_progress_reporter_emits_once_per_interval(capsys, clock):
+    reporter = ProgressReporter(interval=1.0)
+
+    reporter.update("1/10")
+    reporter.update("2/10")
+    clock[0] += 0.5
+    reporter.update("3/10")
+    assert capsys.readouterr().out == "1/10\n"
+
+    clock[0] += 0.6
+    reporter.update("4/10")
+    reporter.update("5/10")
+    assert capsys.readouterr().out == "4/10\n"
+
+
+def test_progress_reporter_flush_emits_pending_message(capsys, clock):
+    reporter = ProgressReporter(interval=1.0)
+    reporter.update("1/10")
+    reporter.update("2/10")
+    reporter.update("3/10")
+    capsys.readouterr()
+
+    reporter.flush()
+    assert capsys.readouterr().out == "3/10\n"
+
+    # Nada pendiente: flush no repite el último mensaje, y el siguiente update respeta el intervalo
+    reporter.flush()
+    reporter.update("4/10")
+    assert capsys.readouterr().out == ""
+
+
+def test_progress_reporter_silent_when_not_verbose(capsys, clock):
+    reporter = ProgressReporter(verbose=False, interval=0.0)
+    reporter.update("1/10")
+    reporter.flush()
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from seq2seq_dataset import bucket_boundaries_for, make_dataset, make_train_val_datasets
+from seq2seq_model import fit_tokenizers
+
+
+@pytest.fixture
+def texts():
+    rng = np.random.default_rng(0)
+    words = [f"w{i}" for i in range(50)]
+    # Primera palabra única por titular para poder identificar cada ejemplo después del bucketing
+    inputs = [f"id{i} " + ' '.join(rng.choice(words, rng.integers(1, 15))) for i in range(40)]
+    targets = ['<start> ' + ' '.join(rng.choice(words, rng.integers(1, 20))) + ' <end>' for _ in range(40)]
+    return inputs, targets
+
+
+def sequences_for(texts):
+    input_tokenizer, target_tokenizer = fit_tokenizers(*texts)
+    encoder_sequences = input_tokenizer.texts_to_sequences(texts[0])
+    decoder_sequences = target_tokenizer.texts_to_sequences(texts[1])
+    return input_tokenizer, target_tokenizer, encoder_sequences, decoder_sequences
+
+
+def unpadded(batch):
+    return [tuple(int(t) for t in row if t != 0) for row in batch.numpy()]
+
+
+def test_targets_are_decoder_inputs_shifted_by_one(texts):
+    _, _, encoder_sequences, decoder_sequences = sequences_for(texts)
+    expected = {tuple(e): d for e, d in zip(encoder_sequences, decoder_sequences)}
+
+    seen = 0
+    for (encoder_input, decoder_input), decoder_output in make_dataset(
+        encoder_sequences, decoder_sequences, batch_size=8, shuffle=False
+    ):
+        for encoder_row, decoder_row, output_row in zip(
+            unpadded(encoder_input), decoder_input.numpy(), decoder_output.numpy()
+        ):
+            target = expected[encoder_row]
+            length = len(target)
+            assert decoder_row[:length].tolist() == target
+            assert output_row[:length].tolist() == target[1:] + [0]
+            # Más allá de la secuencia real todo es relleno
+            assert not decoder_row[length:].any() and not output_row[length:].any()
+            seen += 1
+    assert seen == len(encoder_sequences)
+
+
+def test_batches_are_padded_to_their_own_longest_sequence(texts):
+    _, _, encoder_sequences, decoder_sequences = sequences_for(texts)
+    global_max = max(len(d) for d in decoder_sequences)
+
+    widths = []
+    for (encoder_input, decoder_input), decoder_output in make_dataset(
+        encoder_sequences, decoder_sequences, batch_size=8, shuffle=False
+    ):
+        assert encoder_input.shape[1] == max(len(row) for row in unpadded(encoder_input))
+        assert decoder_input.shape[1] == max(len(row) for row in unpadded(decoder_input))
+        assert decoder_output.shape == decoder_input.shape
+        widths.append(decoder_input.shape[1])
+    assert min(widths) < global_max
+
+
+def test_validation_is_the_last_fraction_in_order(texts):
+    input_tokenizer, target_tokenizer, encoder_sequences, _ = sequences_for(texts)
+    train_ds, val_ds = make_train_val_datasets(
+        *texts, input_tokenizer, target_tokenizer, batch_size=8, validation_split=0.25
+    )
+
+    def encoder_rows(dataset):
+        return [row for (encoder_input, _), _ in dataset for row in unpadded(encoder_input)]
+
+    expected = [tuple(e) for e in encoder_sequences]
+    assert sorted(encoder_rows(train_ds)) == sorted(expected[:30])
+    assert sorted(encoder_rows(val_ds)) == sorted(expected[30:])
+
+
+@pytest.mark.parametrize('n, validation_split', [(40, 0.0), (9, 0.1)])
+def test_no_validation_dataset_when_the_split_is_empty(texts, n, validation_split):
+    input_texts, target_texts = texts[0][:n], texts[1][:n]
+    input_tokenizer, target_tokenizer = fit_tokenizers(input_texts, target_texts)
+    train_ds, val_ds = make_train_val_datasets(
+        input_texts, target_texts, input_tokenizer, target_tokenizer, validation_split=validation_split
+    )
+
+    assert val_ds is None
+    assert sum(len(decoder_output) for _, decoder_output in train_ds) == n
+
+
+def test_bucket_boundaries_of_no_lengths():
+    assert bucket_boundaries_for([]) == []
@@ -0,0 +1,34 @@
+from seq2seq_model import load_or_fit_tokenizers, load_tokenizer_metadata
+
+
+def test_tokenizers_are_refitted_when_training_texts_change(tmp_path):
+    files = dict(
+        input_tokenizer_file=str(tmp_path / 'input.json'),
+        target_tokenizer_file=str(tmp_path / 'target.json'),
+        metadata_file=str(tmp_path / 'tokenizers_meta.json')
+    )
+    targets = ['<start> no creeras lo que paso <end>']
+
+    input_tokenizer, _ = load_or_fit_tokenizers(['congreso aprueba reforma'], targets, **files)
+    assert 'electoral' not in input_tokenizer.word_index
+
+    # Mismos textos: se reutiliza el vocabulario guardado
+    reloaded, _ = load_or_fit_tokenizers(['congreso aprueba reforma'], targets, **files)
+    assert reloaded.word_index == input_tokenizer.word_index
+
+    # Textos nuevos: el vocabulario guardado ya no sirve y se vuelve a ajustar
+    refitted, _ = load_or_fit_tokenizers(['congreso aprueba reforma electoral'], targets, **files)
+    assert 'electoral' in refitted.word_index
+
+
+def test_metadata_stores_training_max_encoder_len(tmp_path):
+    metadata_file = str(tmp_path / 'tokenizers_meta.json')
+    load_or_fit_tokenizers(
+        ['congreso aprueba reforma', 'alcalde inaugura nuevo puente en lima'],
+        ['<start> no creeras lo que paso <end>'] * 2,
+        input_tokenizer_file=str(tmp_path / 'input.json'),
+        target_tokenizer_file=str(tmp_path / 'target.json'),
+        metadata_file=metadata_file
+    )
+    assert load_tokenizer_metadata(metadata_file)['max_encoder_len'] == 6
+    assert load_tokenizer_metadata(str(tmp_path / 'missing.json')) == {}
@@ -0,0 +1,140 @@
+import random
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from nltk import trigrams
+from nltk.tokenize import sent_tokenize, word_tokenize
+
+from utils.utils import format_sentence
+
+
+def tokenize_es(text: str) -> list[list[str]]:
+    if not isinstance(text, str) or not text.strip():
+        return []
+    sentences = sent_tokenize(text, language="spanish")
+    tokenized = []
+    for s in sentences:
+        toks = word_tokenize(s, language="spanish")
+        # lower only alphabetic tokens, keep punctuation as-is
+        toks = [t.lower() if t.isalpha() else t for t in toks]
+        if toks:
+            tokenized.append(toks)
+    return tokenized
+
+
+def load_corpus(df: pd.DataFrame, by_category: bool = False) -> Dict[str, List[List[str]]]:
+    buckets: Dict[str, List[List[str]]] = defaultdict(list)
+
+    for _, row in df.iterrows():
+        categoria = (row.get("seccion") or "").strip()
+        noticia = row.get("contenido")
+
+        if not noticia or not isinstance(noticia, str):
+            continue
+
+        sents_toks = tokenize_es(noticia)
+
+        if by_category and categoria:
+            for s in sents_toks:
+                if s:
+                    buckets[categoria].append(s)
+        else:
+            for s in sents_toks:
+                if s:
+                    buckets["_GLOBAL"].append(s)
+
+    return buckets
+
+
+def train_trigrams(tokenized_sentences: List[List[str]]):
+    """
+      model[(w1,w2)][w3] = prob
+    """
+    model = defaultdict(lambda: defaultdict(float))
+    for sent in tokenized_sentences:
+        for w1, w2, w3 in trigrams(sent, pad_left=True, pad_right=True):
+            model[(w1, w2)][w3] += 1.0
+
+    for w1w2 in model:
+        total = sum(model[w1w2].values())
+        if total > 0:
+            for w3 in model[w1w2]:
+                model[w1w2][w3] /= total
+    return model
+
+
+def sample_next(model: dict, w1: str, w2: str) -> Optional[str]:
+    dist = model.get((w1, w2), {})
+    # Heuristica por si no hay distribución para (w1, w2)
+    if not dist:
+        # Fallback 1: Buscar todos los contextos que terminen en w2
+        for key in model.keys():
+            if key[1] == w2 and model[key]:
+                dist = model[key]
+                break
+        # Fallback 2: Si aún no hay nada, usar inicio de oración
+        if not dist:
+            dist = model.get((None, None), {})
+        # Fallback 3: Si todavía no hay nada, elegir un contexto aleatorio
+        if not dist and model:
+            random_key = random.choice(list(model.keys()))
+            dist = model[random_key]
+
+    r = random.random()
+    acc = 0.0
+    for w3, p in dist.items():
+        acc += p
+        if acc >= r:
+            return w3
+
+    return list(dist.keys())[-1] if dist else None
+
+
+def generate_sentence(model: dict, seeds: Tuple[str, str] = (None, None), max_len: int = 30) -> str:
+    w1 = seeds[0].lower() if seeds[0] and seeds[0] is not None else None
+    w2 = seeds[1].lower() if seeds[1] and seeds[1] is not None else None
+
+    text: List[str] = []
+
+    if w1 is not None:
+        text.append(w1)
+    if w2 is not None:
+        text.append(w2)
+
+    if not text:
+        w1, w2 = None, None
+    elif len(text) == 1:
+        w1, w2 = None, text[0]
+    else:
+        w1, w2 = text[-2] if len(text) >= 2 else None, text[-1]
+
+    sentence_finished = False
+    iterations_without_word = 0
+
+    while not sentence_finished and len(text) < max_len:
+        w3 = sample_next(model, w1, w2)
+        if w3 is None:
+            iterations_without_word += 1
+            if iterations_without_word > 3:
+                sentence_finished = True
+            w1, w2 = None, None
+            continue
+
+        iterations_without_word = 0
+        text.append(w3)
+
+        w1, w2 = w2, w3
+
+        if w3 in ['.', '!', '?']:
+            sentence_finished = True
+
+    return format_sentence(text, capitalize_first=True, add_final_punct=True)
+
+
+def generate_paragraph(model: dict, n_sentences: int = 3, seeds: Tuple[str, str] = (None, None)) -> str:
+    sentences = []
+    sentences.append(generate_sentence(model, seeds=seeds))
+    for _ in range(n_sentences - 1):
+        sentences.append(generate_sentence(model, seeds=(None, None)))
+    return " ".join(sentences)
@@ -0,0 +1,191 @@
+import bisect
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from threading import Lock
+
+# Límites de los buckets de latencia en segundos (1ms .. ~65s)
+DEFAULT_BUCKETS = [0.001 * (2 ** i) for i in range(17)]
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, q):
+        if self.count == 0:
+            return 0.0
+
+        target = q / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= target and bucket_count > 0:
+                # Interpolación lineal dentro del bucket, acotada por el mínimo y máximo observados
+                lower = self.buckets[i - 1] if i > 0 else self.min
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (target - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self.lock = Lock()
+        self.counters = defaultdict(int)
+        self.histograms = defaultdict(Histogram)
+
+    def incr(self, name, value=1):
+        with self.lock:
+            self.counters[name] += value
+
+    def observe(self, name, seconds):
+        with self.lock:
+            self.histograms[name].observe(seconds)
+
+    @contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def merge(self, other, prefix=''):
+        with other.lock:
+            snapshot_counters = dict(other.counters)
+            snapshot_histograms = dict(other.histograms)
+        with self.lock:
+            for name, value in snapshot_counters.items():
+                self.counters[prefix + name] += value
+            for name, hist in snapshot_histograms.items():
+                target = self.histograms[prefix + name]
+                target.counts = [a + b for a, b in zip(target.counts, hist.counts)]
+                target.count += hist.count
+                target.total += hist.total
+                target.min = min(target.min, hist.min)
+                target.max = max(target.max, hist.max)
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'counters': dict(self.counters),
+                'latencies': {name: hist.summary() for name, hist in self.histograms.items()}
+            }
+
+    def report(self):
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in sorted(snapshot['counters'].items()):
+            lines.append(f"{name:<32} {value}")
+        for name, s in sorted(snapshot['latencies'].items()):
+            lines.append(
+                f"{name:<32} n={s['count']:<6} p50={s['p50'] * 1000:.1f}ms "
+                f"p90={s['p90'] * 1000:.1f}ms p99={s['p99'] * 1000:.1f}ms max={s['max'] * 1000:.1f}ms"
+            )
+        return "\n".join(lines)
+
+
+class ProfileResult:
+    def __init__(self):
+        self.cpu = ""
+        self.memory = []
+        self.peak_memory = 0
+
+
+@contextmanager
+def profile(cpu=False, memory=False, top=20):
+    result = ProfileResult()
+    profiler = cProfile.Profile() if cpu else None
+    started_tracemalloc = memory and not tracemalloc.is_tracing()
+
+    if started_tracemalloc:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        yield result
+    finally:
+        if profiler:
+            profiler.disable()
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(top)
+            result.cpu = stream.getvalue()
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            result.memory = [str(stat) for stat in snapshot.statistics('lineno')[:top]]
+            result.peak_memory = tracemalloc.get_traced_memory()[1]
+            if started_tracemalloc:
+                tracemalloc.stop()
+
+
+class ProgressReporter:
+    def __init__(self, verbose=True, interval=1.0, is_jupyter=False):
+        self.verbose = verbose
+        self.interval = interval
+        self.is_jupyter = is_jupyter
+        self.lock = Lock()
+        self.last_emit = 0.0
+        self.pending = None
+
+    def _emit(self, message):
+        if self.is_jupyter:
+            try:
+                from IPython.display import clear_output
+                clear_output(wait=True)
+            except:
+                pass
+        print(message)
+
+    def update(self, message):
+        if not self.verbose:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            if now - self.last_emit < self.interval:
+                self.pending = message
+                return
+            self.last_emit = now
+            self.pending = None
+            self._emit(message)
+
+    def flush(self):
+        with self.lock:
+            if self.verbose and self.pending is not None:
+                self._emit(self.pending)
+                self.pending = None
+                self.last_emit = time.monotonic()